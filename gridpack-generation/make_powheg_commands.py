@@ -1,7 +1,6 @@
 # Make the Powheg commands for the several stages and iterations of the calculation
 
 import os
-import sys
 import argparse
 
 if __name__=='__main__':
@@ -1,17 +1,16 @@
-import os
-import sys
+import subprocess
 
 
 def get_condor_q(do_check=False):
     # get the output by condor_q as a list of strings
-    # note: works by writing condor_q output to a temporary file and reading it
+    # note: the output is captured directly rather than via a temporary file,
+    #       so concurrent calls (e.g. staggered cron jobs) do not interfere.
 
     # get the output of condor_q
-    tempfile = 'check_running_jobs.txt'
-    os.system('condor_q > {}'.format(tempfile))
-    with open(tempfile, 'r') as f: lines = f.readlines()
+    res = subprocess.run('condor_q', shell=True,
+            stdout=subprocess.PIPE, universal_newlines=True)
+    lines = res.stdout.splitlines(True)
     lines = [line for line in lines if line!='\n']
-    os.system('rm {}'.format(tempfile))
 
     # do a syntax check if requested
     if do_check:
@@ -26,7 +26,6 @@
 #   The latter has not been used in a long time however, so not sure.
 
 
-import sys
 import os
 import argparse
 import glob
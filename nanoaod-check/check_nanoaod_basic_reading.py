@@ -2,8 +2,6 @@
 
 
 import os
-import sys
-import numpy as np
 import awkward as ak
 from coffea.nanoevents import NanoEventsFactory, NanoAODSchema
 import argparse